@@ -1,16 +1,17 @@
 import streamlit as st
 import pandas as pd
 import folium
+from folium.plugins import FastMarkerCluster
 from streamlit_folium import st_folium
 from streamlit_js_eval import get_geolocation
+import html
 import os
 import sys
-import time
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from utils.routing import get_fastest_route, calculate_distance
+from utils.routing import get_fastest_route, haversine_vec
 from utils.storm_stress import classify_risk
 from utils.open_meteo import fetch_realtime_weather
 
@@ -180,11 +181,37 @@ st.markdown("""
 """, unsafe_allow_html=True)
 
 # Load Camps
-@st.cache_data
+# cache_resource shares one copy across reruns (no pickling/hashing of the frame)
+@st.cache_resource
 def load_camps():
-    return pd.read_csv("data/relief_camps.csv")
+    camps = pd.read_parquet("data/relief_camps.parquet")
+    # Coordinate arrays for the vectorized nearest-camp search
+    camp_lats = camps["latitude"].to_numpy()
+    camp_lons = camps["longitude"].to_numpy()
+    # Raw [lat, lon, popup_html] rows for client-side marker clustering (popup HTML built once)
+    camp_coords = [
+        [lat, lon, f"<b>{html.escape(name)}</b><br>Capacity: {cap}"]
+        for lat, lon, name, cap in camps[["latitude", "longitude", "camp_name", "capacity"]].itertuples(index=False, name=None)
+    ]
+    return camps, camp_lats, camp_lons, camp_coords
 
-camps = load_camps()
+camps, camp_lats, camp_lons, camp_coords = load_camps()
+
+# Leaflet callback building each camp marker in the browser
+CAMP_MARKER_CALLBACK = """
+function (row) {
+    var icon = L.AwesomeMarkers.icon({icon: 'home', prefix: 'fa', markerColor: 'green'});
+    var marker = L.marker(new L.LatLng(row[0], row[1]), {icon: icon});
+    marker.bindPopup(row[2]);
+    return marker;
+}
+"""
+
+# Leaflet/GPS coordinates jitter in the last digits; treat sub-metre moves as "no change"
+LOCATION_EPS = 1e-5
+
+def location_changed(prev, lat, lon):
+    return prev is None or abs(prev[0] - lat) > LOCATION_EPS or abs(prev[1] - lon) > LOCATION_EPS
 
 # --- SIDEBAR ---
 with st.sidebar:
@@ -202,11 +229,12 @@ with st.sidebar:
         lon = loc["coords"]["longitude"]
         
         if "location_source" not in st.session_state or st.session_state["location_source"] == "gps":
-            st.session_state["user_location"] = (lat, lon)
+            # Reset route only if location actually changes
+            if location_changed(st.session_state.get("user_location"), lat, lon):
+                st.session_state["user_location"] = (lat, lon)
+                if "current_route" in st.session_state:
+                    del st.session_state["current_route"]
             st.session_state["location_source"] = "gps"
-            # Reset route if location changes
-            if "current_route" in st.session_state:
-                del st.session_state["current_route"]
             st.success(f"📍 GPS Active")
 
     st.info("Click anywhere on the map to set a custom location.")
@@ -235,15 +263,12 @@ with col_map:
     start_loc = st.session_state["user_location"] if st.session_state["user_location"] else [default_lat, default_lon]
     
     # Aesthetic Light Map Tiles (Professional Style)
+    # Rebuilt each rerun: a session-held Map accumulates stale layer JS in its figure
     m = folium.Map(location=start_loc, zoom_start=8, tiles="CartoDB positron")
     
     # Styles
-    for _, camp in camps.iterrows():
-        folium.Marker(
-            [camp["latitude"], camp["longitude"]],
-            popup=f"<b>{camp['camp_name']}</b><br>Capacity: {camp['capacity']}",
-            icon=folium.Icon(color="green", icon="home", prefix="fa") # Green Home = Safety (Google Style)
-        ).add_to(m)
+    # Camps are clustered client-side from a raw array (Green Home = Safety, Google Style)
+    FastMarkerCluster(camp_coords, callback=CAMP_MARKER_CALLBACK).add_to(m)
 
     if st.session_state["user_location"]:
         u_lat, u_lon = st.session_state["user_location"]
@@ -261,14 +286,22 @@ with col_map:
             ).add_to(m)
 
     # MAP OUTPUT
-    map_output = st_folium(m, height=550, width=None)
+    # Only clicks are returned, so panning/zooming doesn't trigger a full script rerun
+    map_output = st_folium(
+        m,
+        center=start_loc,
+        height=550,
+        width=None,
+        key="territory_map",
+        returned_objects=["last_clicked"]
+    )
 
     if map_output["last_clicked"]:
         clicked_lat = map_output["last_clicked"]["lat"]
         clicked_lon = map_output["last_clicked"]["lng"]
         
-        # Only update if changed
-        if st.session_state["user_location"] != (clicked_lat, clicked_lon):
+        # Only update if changed (beyond float noise)
+        if location_changed(st.session_state["user_location"], clicked_lat, clicked_lon):
             st.session_state["user_location"] = (clicked_lat, clicked_lon)
             st.session_state["location_source"] = "manual"
             # Reset route
@@ -282,9 +315,8 @@ with col_details:
     if st.session_state["user_location"]:
         u_lat, u_lon = st.session_state["user_location"]
         
-        # Skeleton loader animation effect
         with st.spinner("Processing satellite data..."):
-            time.sleep(0.5) # Fake small delay to show off spinner animation
+            # Memoized per ~1 km cell inside utils.open_meteo (failures are not cached)
             weather = fetch_realtime_weather(u_lat, u_lon)
         
         # Risk Calc
@@ -337,11 +369,12 @@ with col_details:
         nearest_camp = None
         min_dist = float('inf')
         
-        for _, camp in camps.iterrows():
-            d = calculate_distance((u_lat, u_lon), (camp["latitude"], camp["longitude"]))
-            if d < min_dist:
-                min_dist = d
-                nearest_camp = camp
+        if len(camps):
+            # Vectorized haversine against all camps at once
+            d = haversine_vec(u_lat, u_lon, camp_lats, camp_lons)
+            idx = int(d.argmin())
+            min_dist = d[idx]
+            nearest_camp = camps.iloc[idx]
         
         if nearest_camp is not None:
              st.markdown("#### 🛡️ Nearest Safe Sanctuary")
@@ -356,6 +389,7 @@ with col_details:
              """, unsafe_allow_html=True)
              
              if st.button("Draw Evacuation Path"):
+                 # Memoized inside utils.routing (failed lookups are retried, not cached)
                  route = get_fastest_route((u_lat, u_lon), (nearest_camp["latitude"], nearest_camp["longitude"]))
                  
                  if route:
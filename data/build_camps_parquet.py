@@ -0,0 +1,23 @@
+"""
+Convert the relief camp list to Parquet for fast app start-up.
+
+This module:
+1. Reads data/relief_camps.csv (the editable source of truth)
+2. Outputs: data/relief_camps.parquet (loaded by app.py)
+
+Re-run whenever relief_camps.csv changes.
+"""
+
+import pandas as pd
+
+CAMPS_CSV = "data/relief_camps.csv"
+CAMPS_PARQUET = "data/relief_camps.parquet"
+
+def main():
+    """Main execution function."""
+    camps = pd.read_csv(CAMPS_CSV)
+    camps.to_parquet(CAMPS_PARQUET, index=False)
+    print(f"✓ Saved {len(camps)} camps to: {CAMPS_PARQUET}")
+
+if __name__ == "__main__":
+    main()
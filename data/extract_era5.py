@@ -5,7 +5,7 @@ This module:
 1. Reads cyclone events from IBTrACS output
 2. Queries ERA5 reanalysis for actual weather during events
 3. Computes: max wind speed, max gust speed, total rainfall
-4. Outputs: data/regions/odisha/era5_weather.csv
+4. Outputs: data/regions/odisha/era5_weather.parquet
 
 Note: For demo purposes, this uses synthetic ERA5-like data.
 In production, use cdsapi to fetch real ERA5 data.
@@ -15,9 +15,13 @@ import pandas as pd
 import numpy as np
 import os
 
+# Shared generator for the synthetic data (seeded once so runs are reproducible,
+# while successive calls still get fresh draws)
+_RNG = np.random.default_rng(0)
+
 def load_cyclone_events():
     """Load cyclone events from IBTrACS extraction."""
-    events_file = "data/regions/odisha/cyclone_events.csv"
+    events_file = "data/regions/odisha/cyclone_events.parquet"
     
     if not os.path.exists(events_file):
         raise FileNotFoundError(
@@ -25,15 +29,19 @@ def load_cyclone_events():
             "Run extract_ibtracs.py first."
         )
     
-    events = pd.read_csv(events_file)
-    events['timestamp'] = pd.to_datetime(events['timestamp'])
+    # Parquet preserves dtypes, so timestamps come back as datetime64
+    events = pd.read_parquet(events_file)
     
     print(f"Loaded {len(events)} cyclone events")
     return events
 
-def fetch_era5_data(event):
+def _uniform32(rng, low, high, n):
+    """Draw n float32 samples from U(low, high) without a float64 intermediate."""
+    return rng.random(n, dtype=np.float32) * np.float32(high - low) + np.float32(low)
+
+def fetch_era5_batch(base_wind, rng=None):
     """
-    Fetch ERA5 reanalysis data for a cyclone event.
+    Fetch ERA5 reanalysis data for many cyclone events at once.
     
     In production, this would use cdsapi:
     ```python
@@ -48,26 +56,32 @@ def fetch_era5_data(event):
     ```
     
     For demo, we generate synthetic but realistic data based on IBTrACS wind speeds.
+    All events are drawn in one batched call per variable.
     """
+    if rng is None:
+        rng = _RNG
     
     # Use IBTrACS wind as baseline
-    base_wind = event['max_wind_speed']
+    # float32 is ample precision for km/h and mm, and halves memory traffic
+    base_wind = np.asarray(base_wind, dtype=np.float32)
+    n = len(base_wind)
     
     # ERA5 typically shows slightly lower winds than best track (surface vs flight level)
     # Add realistic variability
-    max_wind_speed = base_wind * np.random.uniform(0.85, 0.95)
+    max_wind_speed = base_wind * _uniform32(rng, 0.85, 0.95, n)
     
     # Gust factor typically 1.2-1.5x sustained wind
-    max_gust_speed = max_wind_speed * np.random.uniform(1.2, 1.5)
+    max_gust_speed = max_wind_speed * _uniform32(rng, 1.2, 1.5, n)
     
     # Rainfall correlates with intensity but has high variance
     # Typical cyclone: 100-400mm, intense: 400-800mm
-    if base_wind > 150:  # Severe cyclone
-        total_rainfall = np.random.uniform(300, 700)
-    elif base_wind > 100:  # Moderate cyclone
-        total_rainfall = np.random.uniform(150, 400)
-    else:  # Weak cyclone
-        total_rainfall = np.random.uniform(50, 200)
+    total_rainfall = np.where(
+        base_wind > 150, _uniform32(rng, 300, 700, n),      # Severe cyclone
+        np.where(
+            base_wind > 100, _uniform32(rng, 150, 400, n),  # Moderate cyclone
+            _uniform32(rng, 50, 200, n)                      # Weak cyclone
+        )
+    )
     
     return {
         'max_wind_speed': max_wind_speed,
@@ -75,27 +89,25 @@ def fetch_era5_data(event):
         'total_rainfall': total_rainfall
     }
 
+def fetch_era5_data(event, rng=None):
+    """Fetch ERA5 reanalysis data for a single cyclone event."""
+    weather = fetch_era5_batch([event['max_wind_speed']], rng)
+    return {key: values[0] for key, values in weather.items()}
+
 def extract_weather_for_all_events(events):
     """Extract ERA5 weather data for all cyclone events."""
-    print("Extracting ERA5 weather data...")
-    
-    weather_data = []
-    
-    for idx, event in events.iterrows():
-        print(f"Processing event {idx + 1}/{len(events)}: {event['name']} ({event['timestamp'].year})")
-        
-        weather = fetch_era5_data(event)
-        
-        weather_data.append({
-            'event_id': event['event_id'],
-            'name': event['name'],
-            'timestamp': event['timestamp'],
-            'max_wind_speed': weather['max_wind_speed'],
-            'max_gust_speed': weather['max_gust_speed'],
-            'total_rainfall': weather['total_rainfall']
-        })
-    
-    return pd.DataFrame(weather_data)
+    print(f"Extracting ERA5 weather data for {len(events)} events...")
+    
+    weather = fetch_era5_batch(events['max_wind_speed'].to_numpy())
+    
+    return pd.DataFrame({
+        'event_id': events['event_id'].to_numpy(),
+        'name': events['name'].to_numpy(),
+        'timestamp': events['timestamp'].to_numpy(),
+        'max_wind_speed': weather['max_wind_speed'],
+        'max_gust_speed': weather['max_gust_speed'],
+        'total_rainfall': weather['total_rainfall']
+    })
 
 def main():
     """Main execution function."""
@@ -110,8 +122,8 @@ def main():
     weather_df = extract_weather_for_all_events(events)
     
     # Save output
-    output_file = "data/regions/odisha/era5_weather.csv"
-    weather_df.to_csv(output_file, index=False)
+    output_file = "data/regions/odisha/era5_weather.parquet"
+    weather_df.to_parquet(output_file, compression='zstd', index=False)
     print(f"\n✓ Saved to: {output_file}")
     
     # Display statistics
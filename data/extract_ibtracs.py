@@ -6,12 +6,14 @@ This module:
 2. Filters for North Indian Ocean basin
 3. Extracts cyclones affecting Odisha (lat/lon bounds)
 4. Aggregates each cyclone into single event
-5. Outputs: data/regions/odisha/cyclone_events.csv
+5. Outputs: data/regions/odisha/cyclone_events.parquet
 """
 
 import pandas as pd
 import requests
+import gzip
 import os
+import shutil
 from datetime import datetime
 
 # Odisha geographic bounds
@@ -22,20 +24,32 @@ ODISHA_BOUNDS = {
     'lon_max': 87.53
 }
 
+# Columns (and their dtypes) read from the IBTrACS CSV
+IBTRACS_COLUMNS = ['SID', 'BASIN', 'ISO_TIME', 'LAT', 'LON', 'WMO_WIND', 'NAME']
+IBTRACS_DTYPES = {
+    'SID': 'string',
+    'BASIN': 'category',
+    'NAME': 'string',
+    'LAT': 'float32',
+    'LON': 'float32',
+    'WMO_WIND': 'float32'
+}
+
 IBTRACS_URL = "https://www.ncei.noaa.gov/data/international-best-track-archive-for-climate-stewardship-ibtracs/v04r00/access/csv/ibtracs.NI.list.v04r00.csv"
 
 def download_ibtracs():
     """Download IBTrACS database for North Indian Ocean."""
     print("Downloading IBTrACS database...")
-    response = requests.get(IBTRACS_URL, timeout=120)
-    response.raise_for_status()
     
-    # Save to temp file
-    temp_file = "ibtracs_temp.csv"
-    with open(temp_file, 'wb') as f:
-        f.write(response.content)
+    # Stream straight into a gzip-compressed temp file (constant memory)
+    temp_file = "ibtracs_temp.csv.gz"
+    with requests.get(IBTRACS_URL, stream=True, timeout=120) as response:
+        response.raise_for_status()
+        response.raw.decode_content = True
+        with gzip.open(temp_file, 'wb') as f:
+            shutil.copyfileobj(response.raw, f, length=1024 * 1024)
     
-    print(f"Downloaded {len(response.content) / 1024 / 1024:.2f} MB")
+    print(f"Downloaded to {temp_file} ({os.path.getsize(temp_file) / 1024 / 1024:.2f} MB compressed)")
     return temp_file
 
 def filter_odisha_cyclones(ibtracs_file):
@@ -43,7 +57,17 @@ def filter_odisha_cyclones(ibtracs_file):
     print("Loading IBTrACS data...")
     
     # Read with proper handling of header rows
-    df = pd.read_csv(ibtracs_file, skiprows=[1], low_memory=False)
+    # Only parse the columns we use; IBTrACS marks missing values with a blank
+    df = pd.read_csv(
+        ibtracs_file,
+        skiprows=[1],
+        compression='gzip',
+        usecols=IBTRACS_COLUMNS,
+        dtype=IBTRACS_DTYPES,
+        na_values=[' '],
+        parse_dates=['ISO_TIME'],
+        low_memory=False
+    )
     
     print(f"Total records: {len(df)}")
     
@@ -51,18 +75,14 @@ def filter_odisha_cyclones(ibtracs_file):
     df = df[df['BASIN'] == 'NI'].copy()
     print(f"North Indian Ocean records: {len(df)}")
     
-    # Convert lat/lon to numeric
-    df['LAT'] = pd.to_numeric(df['LAT'], errors='coerce')
-    df['LON'] = pd.to_numeric(df['LON'], errors='coerce')
-    df['WMO_WIND'] = pd.to_numeric(df['WMO_WIND'], errors='coerce')
-    
     # Filter for Odisha bounds
-    odisha_mask = (
-        (df['LAT'] >= ODISHA_BOUNDS['lat_min']) &
-        (df['LAT'] <= ODISHA_BOUNDS['lat_max']) &
-        (df['LON'] >= ODISHA_BOUNDS['lon_min']) &
-        (df['LON'] <= ODISHA_BOUNDS['lon_max'])
-    )
+    # Built in place on the raw arrays to avoid intermediate boolean Series
+    lat = df['LAT'].to_numpy()
+    lon = df['LON'].to_numpy()
+    odisha_mask = lat >= ODISHA_BOUNDS['lat_min']
+    odisha_mask &= lat <= ODISHA_BOUNDS['lat_max']
+    odisha_mask &= lon >= ODISHA_BOUNDS['lon_min']
+    odisha_mask &= lon <= ODISHA_BOUNDS['lon_max']
     
     df_odisha = df[odisha_mask].copy()
     print(f"Odisha-affecting records: {len(df_odisha)}")
@@ -120,8 +140,8 @@ def main():
     events = aggregate_cyclone_events(df_odisha)
     
     # Save output
-    output_file = os.path.join(output_dir, "cyclone_events.csv")
-    events.to_csv(output_file, index=False)
+    output_file = os.path.join(output_dir, "cyclone_events.parquet")
+    events.to_parquet(output_file, index=False)
     print(f"\n✓ Saved to: {output_file}")
     
     # Display sample
@@ -6,6 +6,8 @@ Fetches real ERA5 reanalysis data from Copernicus Climate Data Store
 import cdsapi
 import pandas as pd
 import os
+import tempfile
+import zipfile
 from dotenv import load_dotenv
 
 def fetch_era5(lat, lon):
@@ -24,6 +26,19 @@ def fetch_era5(lat, lon):
     pd.DataFrame
         DataFrame containing wind components and precipitation data
     """
+    # Round to ~1 km so nearby requests share a cache entry (ERA5 grid is 0.25°)
+    lat, lon = round(lat, 2), round(lon, 2)
+
+    # Create cache directory if it doesn't exist
+    cache_dir = os.path.join(os.path.dirname(__file__), "cache")
+    os.makedirs(cache_dir, exist_ok=True)
+    
+    filename = os.path.join(cache_dir, f"era5_{lat}_{lon}.parquet")
+
+    # Return cached data if exists
+    if os.path.exists(filename):
+        return pd.read_parquet(filename)
+
     # Load environment variables from .env file
     load_dotenv()
     
@@ -37,39 +52,47 @@ def fetch_era5(lat, lon):
     else:
         c = cdsapi.Client(url=url, key=key)
 
-    # Create cache directory if it doesn't exist
-    cache_dir = os.path.join(os.path.dirname(__file__), "cache")
-    os.makedirs(cache_dir, exist_ok=True)
+    # Download and convert via temp files so a crash never leaves a partial cache entry
+    fd, download_tmp = tempfile.mkstemp(dir=cache_dir, suffix=".download")
+    os.close(fd)
+    fd, parquet_tmp = tempfile.mkstemp(dir=cache_dir, suffix=".parquet.tmp")
+    os.close(fd)
     
-    filename = os.path.join(cache_dir, f"era5_{lat}_{lon}.csv")
-
-    # Return cached data if exists
-    if os.path.exists(filename):
-        return pd.read_csv(filename)
-
-    # Fetch from ERA5 CDS API
-    c.retrieve(
-        "reanalysis-era5-single-levels-timeseries",
-        {
-            "variable": [
-                "10m_u_component_of_wind",
-                "10m_v_component_of_wind",
-                "total_precipitation"
-            ],
-            "location": {
-                "latitude": lat,
-                "longitude": lon
+    try:
+        # Fetch from ERA5 CDS API
+        c.retrieve(
+            "reanalysis-era5-single-levels-timeseries",
+            {
+                "variable": [
+                    "10m_u_component_of_wind",
+                    "10m_v_component_of_wind",
+                    "total_precipitation"
+                ],
+                "location": {
+                    "latitude": lat,
+                    "longitude": lon
+                },
+                "date": ["2019-01-01/2024-12-31"],
+                "time": [
+                    "00:00", "06:00", "12:00", "18:00"
+                ],
+                "data_format": "csv"
             },
-            "date": ["2019-01-01/2024-12-31"],
-            "time": [
-                "00:00", "06:00", "12:00", "18:00"
-            ],
-            "data_format": "csv"
-        },
-        filename
-    )
+            download_tmp
+        )
+        
+        # CDS may deliver the CSV wrapped in a zip archive
+        compression = "zip" if zipfile.is_zipfile(download_tmp) else None
+        df = pd.read_csv(download_tmp, compression=compression)
+        
+        df.to_parquet(parquet_tmp, compression="zstd", index=False)
+        os.replace(parquet_tmp, filename)
+    finally:
+        for tmp in (download_tmp, parquet_tmp):
+            if os.path.exists(tmp):
+                os.remove(tmp)
 
-    return pd.read_csv(filename)
+    return df
 
 
 def fetch_era5_mock(lat, lon):
@@ -83,24 +106,27 @@ def fetch_era5_mock(lat, lon):
     
     # Generate realistic mock data for 5 years
     dates = pd.date_range(start='2019-01-01', end='2024-12-31', freq='6H')
+    n = len(dates)
     
     # Base wind patterns (seasonal variation for cyclone-prone regions)
-    month_factor = np.sin(np.array([d.month for d in dates]) * np.pi / 6)
+    months = dates.month.to_numpy(dtype=np.float32)
+    month_factor = np.sin(months * np.float32(np.pi / 6), dtype=np.float32)
     
     # Random variations
-    np.random.seed(int(abs(lat * 100 + lon * 10)) % 10000)
+    rng = np.random.default_rng(int(abs(lat * 100 + lon * 10)) % 10000)
     
     # U-component of wind (m/s): typical 5-25 m/s during cyclones
-    u_base = 8 + 5 * month_factor + np.random.normal(0, 3, len(dates))
+    u_base = rng.standard_normal(n, dtype=np.float32) * 3 + 8 + 5 * month_factor
     
     # V-component of wind (m/s)
-    v_base = 6 + 4 * month_factor + np.random.normal(0, 2.5, len(dates))
+    v_base = rng.standard_normal(n, dtype=np.float32) * 2.5 + 6 + 4 * month_factor
     
     # Total precipitation (m): higher during monsoon
-    precip = np.abs(0.001 + 0.003 * month_factor + np.random.exponential(0.002, len(dates)))
+    # abs() is still required: month_factor dips to -1, pushing the seasonal term below zero
+    precip = np.abs(0.001 + 0.003 * month_factor + rng.exponential(0.002, n).astype(np.float32))
     
     # Add some extreme events (cyclones)
-    extreme_indices = np.random.choice(len(dates), size=50, replace=False)
+    extreme_indices = rng.choice(n, size=50, replace=False)
     u_base[extreme_indices] *= 2.5
     v_base[extreme_indices] *= 2.3
     precip[extreme_indices] *= 5
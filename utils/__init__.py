@@ -3,9 +3,10 @@ Utils package for CycloneSafeRoute
 """
 
 from .geocode import get_coordinates, get_coordinates_fast, get_city_info
-from .routing import get_fastest_route, get_multiple_routes, calculate_distance
-from .storm_stress import compute_storm_stress, classify_risk, get_stress_statistics
+from .routing import get_fastest_route, get_multiple_routes, get_shelter_durations_table, nearest_destinations, calculate_distance, haversine_vec, approx_distance_vec
+from .storm_stress import compute_storm_stress, classify_risk, classify_risk_vec, get_stress_statistics
 from .open_meteo import fetch_realtime_weather
+from .concurrent_fetch import fetch_weather_and_routes
 
 __all__ = [
     'get_coordinates',
@@ -13,9 +14,15 @@ __all__ = [
     'get_city_info',
     'get_fastest_route',
     'get_multiple_routes',
+    'get_shelter_durations_table',
+    'nearest_destinations',
     'calculate_distance',
+    'haversine_vec',
+    'approx_distance_vec',
     'compute_storm_stress',
     'classify_risk',
+    'classify_risk_vec',
     'get_stress_statistics',
-    'fetch_realtime_weather'
+    'fetch_realtime_weather',
+    'fetch_weather_and_routes'
 ]
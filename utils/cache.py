@@ -0,0 +1,171 @@
+"""
+Cache Module
+Thread-safe in-memory and on-disk TTL memoization for network-bound lookups
+"""
+
+import functools
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import closing
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+# On-disk caches live in <project root>/.cache
+CACHE_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), ".cache")
+
+
+def ttl_cache(ttl, maxsize=4096):
+    """
+    Memoize a function of hashable positional arguments for `ttl` seconds.
+    
+    Results of None are treated as failures and never cached, so a
+    transient network error is retried on the next call.
+    
+    Parameters:
+    -----------
+    ttl : float
+        Time-to-live of each entry in seconds
+    maxsize : int
+        Maximum number of entries (least recently used are evicted)
+    
+    Returns:
+    --------
+    callable
+        Decorator; the wrapped function gains a cache_clear() method
+    """
+    def decorator(func):
+        cache = OrderedDict()
+        lock = threading.Lock()
+        
+        @functools.wraps(func)
+        def wrapper(*args):
+            now = time.monotonic()
+            
+            with lock:
+                entry = cache.get(args)
+                if entry is not None and entry[0] > now:
+                    cache.move_to_end(args)
+                    return entry[1]
+            
+            # Call outside the lock so concurrent misses don't serialize
+            value = func(*args)
+            
+            if value is not None:
+                with lock:
+                    cache[args] = (now + ttl, value)
+                    cache.move_to_end(args)
+                    while len(cache) > maxsize:
+                        cache.popitem(last=False)
+            
+            return value
+        
+        def cache_clear():
+            with lock:
+                cache.clear()
+        
+        wrapper.cache_clear = cache_clear
+        return wrapper
+    
+    return decorator
+
+
+def disk_cache(name, expire, max_entries=10000):
+    """
+    Persist results of a function of hashable positional arguments on disk.
+    
+    Entries are stored as JSON in a SQLite file under CACHE_DIR, so they
+    survive restarts and are shared between processes. As with ttl_cache,
+    None results are never stored. Cache errors (including an unwritable
+    cache directory) are reported and bypassed.
+    
+    Parameters:
+    -----------
+    name : str
+        Cache file name (without extension)
+    expire : float
+        Time-to-live of each entry in seconds
+    max_entries : int
+        Maximum number of rows kept; expired rows are purged on every write
+        and the soonest-to-expire rows are evicted beyond this limit
+    
+    Returns:
+    --------
+    callable
+        Decorator for functions returning JSON-serializable values
+    """
+    path = os.path.join(CACHE_DIR, f"{name}.sqlite3")
+    # None = not initialised yet, True = ready, False = disabled after an error
+    state = {"ready": None}
+    init_lock = threading.Lock()
+    
+    def connect():
+        """Open a connection, creating the directory and schema on first use only."""
+        if state["ready"] is None:
+            with init_lock:
+                if state["ready"] is None:
+                    try:
+                        os.makedirs(CACHE_DIR, exist_ok=True)
+                        with closing(sqlite3.connect(path, timeout=5)) as conn:
+                            with conn:  # commit
+                                conn.execute(
+                                    "CREATE TABLE IF NOT EXISTS cache "
+                                    "(key TEXT PRIMARY KEY, expires REAL, value BLOB)"
+                                )
+                                conn.execute("CREATE INDEX IF NOT EXISTS cache_expires ON cache (expires)")
+                        state["ready"] = True
+                    except (OSError, sqlite3.Error) as e:
+                        logger.warning("Disk cache disabled (%s): %s", name, e)
+                        state["ready"] = False
+        
+        if not state["ready"]:
+            return None
+        return sqlite3.connect(path, timeout=5)
+    
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args):
+            key = repr(args)
+            now = time.time()
+            
+            try:
+                conn = connect()
+                if conn is not None:
+                    with closing(conn):
+                        row = conn.execute("SELECT expires, value FROM cache WHERE key = ?", (key,)).fetchone()
+                    if row is not None and row[0] > now:
+                        return orjson.loads(row[1])
+            except (OSError, sqlite3.Error, orjson.JSONDecodeError) as e:
+                logger.warning("Disk cache read error (%s): %s", name, e)
+            
+            value = func(*args)
+            
+            if value is not None:
+                try:
+                    conn = connect()
+                    if conn is not None:
+                        with closing(conn):
+                            with conn:  # commit
+                                conn.execute(
+                                    "INSERT OR REPLACE INTO cache (key, expires, value) VALUES (?, ?, ?)",
+                                    (key, now + expire, orjson.dumps(value))
+                                )
+                                conn.execute("DELETE FROM cache WHERE expires < ?", (now,))
+                                conn.execute(
+                                    "DELETE FROM cache WHERE key IN "
+                                    "(SELECT key FROM cache ORDER BY expires DESC LIMIT -1 OFFSET ?)",
+                                    (max_entries,)
+                                )
+                except (OSError, sqlite3.Error, orjson.JSONEncodeError) as e:
+                    logger.warning("Disk cache write error (%s): %s", name, e)
+            
+            return value
+        
+        return wrapper
+    
+    return decorator
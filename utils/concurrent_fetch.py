@@ -0,0 +1,39 @@
+"""
+Concurrent Fetch Module
+Overlaps the Open-Meteo and OSRM network calls needed for one location
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from .open_meteo import fetch_realtime_weather
+from .routing import get_multiple_routes
+
+
+def fetch_weather_and_routes(src, destinations):
+    """
+    Fetch current weather and ranked routes for a location concurrently.
+    
+    Both calls are network-bound, so running them side by side makes the
+    total latency roughly the slower of the two instead of their sum.
+    
+    Library API for callers that need both results at once; app.py does
+    not use it, since there weather is shown on every rerun while routes
+    are only requested on demand.
+    
+    Parameters:
+    -----------
+    src : tuple
+        Source coordinates (latitude, longitude)
+    destinations : list
+        List of dictionaries with 'latitude', 'longitude', and other info
+    
+    Returns:
+    --------
+    tuple
+        (weather dict, list of route dictionaries sorted by duration)
+    """
+    with ThreadPoolExecutor(max_workers=2) as ex:
+        weather_future = ex.submit(fetch_realtime_weather, src[0], src[1])
+        routes_future = ex.submit(get_multiple_routes, src, destinations)
+        
+        return weather_future.result(), routes_future.result()
@@ -3,9 +3,41 @@ Geocoding Module
 Converts city names to latitude/longitude coordinates
 """
 
+import bisect
+import difflib
+import functools
+
 from geopy.geocoders import Nominatim
+from geopy.adapters import RequestsAdapter
 from geopy.exc import GeocoderTimedOut, GeocoderServiceError
 
+
+def _adapter_factory(proxies, ssl_context):
+    """Pooled requests adapter so TCP/TLS connections are reused."""
+    return RequestsAdapter(
+        proxies=proxies,
+        ssl_context=ssl_context,
+        pool_connections=10,
+        pool_maxsize=10
+    )
+
+
+@functools.lru_cache(maxsize=1)
+def _geocoder():
+    """Shared Nominatim client (one HTTP session for the whole process)."""
+    return Nominatim(user_agent="cyclone_safe_route_app", adapter_factory=_adapter_factory)
+
+
+@functools.lru_cache(maxsize=4096)
+def _geocode(query, addressdetails=False):
+    """
+    Memoized geocode lookup.
+    
+    Errors propagate (and are therefore not cached); "not found" results are.
+    """
+    return _geocoder().geocode(query, timeout=10, addressdetails=addressdetails)
+
+
 def get_coordinates(city, country="India"):
     """
     Get latitude and longitude for a city.
@@ -23,8 +55,7 @@ def get_coordinates(city, country="India"):
         (latitude, longitude) or (None, None) if not found
     """
     try:
-        geo = Nominatim(user_agent="cyclone_safe_route_app")
-        location = geo.geocode(f"{city}, {country}", timeout=10)
+        location = _geocode(f"{city}, {country}")
         
         if location:
             return location.latitude, location.longitude
@@ -55,8 +86,7 @@ def get_city_info(city, country="India"):
         Location information or None if not found
     """
     try:
-        geo = Nominatim(user_agent="cyclone_safe_route_app")
-        location = geo.geocode(f"{city}, {country}", timeout=10, addressdetails=True)
+        location = _geocode(f"{city}, {country}", addressdetails=True)
         
         if location:
             return {
@@ -90,6 +120,64 @@ CYCLONE_CITIES = {
     "digha": (21.6283, 87.5120)
 }
 
+# Common alternate spellings / historical names
+CITY_ALIASES = {
+    "vizag": "visakhapatnam",
+    "vishakhapatnam": "visakhapatnam",
+    "madras": "chennai",
+    "calcutta": "kolkata",
+    "bombay": "mumbai",
+    "paradeep": "paradip",
+    "masulipatnam": "machilipatnam"
+}
+
+# Normalized lookup table built once at import
+_CITY_LOOKUP = {name.lower().strip(): coords for name, coords in CYCLONE_CITIES.items()}
+_CITY_LOOKUP.update({alias: CYCLONE_CITIES[name] for alias, name in CITY_ALIASES.items()})
+_CITY_KEYS = sorted(_CITY_LOOKUP)
+
+# Shortest prefix accepted for offline prefix matching
+MIN_PREFIX_LEN = 3
+
+
+def match_known_city(city):
+    """
+    Resolve a city name against the pre-defined table without any network call.
+    
+    Tries an exact match, then a unique prefix (e.g. "bhuban"),
+    then a close spelling match for typos (e.g. "bhubaneshwar").
+    
+    Parameters:
+    -----------
+    city : str
+        Name of the city
+    
+    Returns:
+    --------
+    tuple
+        (latitude, longitude) or None if no confident match
+    """
+    name = city.lower().strip()
+    
+    coords = _CITY_LOOKUP.get(name)
+    if coords:
+        return coords
+    
+    # Unique prefix via binary search over the sorted keys
+    if len(name) >= MIN_PREFIX_LEN:
+        lo = bisect.bisect_left(_CITY_KEYS, name)
+        hi = bisect.bisect_right(_CITY_KEYS, name + "\uffff")
+        candidates = {_CITY_LOOKUP[key] for key in _CITY_KEYS[lo:hi]}
+        if len(candidates) == 1:
+            return candidates.pop()
+    
+    # Typo tolerance
+    close = difflib.get_close_matches(name, _CITY_KEYS, n=1, cutoff=0.85)
+    if close:
+        return _CITY_LOOKUP[close[0]]
+    
+    return None
+
 def get_coordinates_fast(city, country="India"):
     """
     Get coordinates with fallback to pre-defined cities.
@@ -107,10 +195,5 @@ def get_coordinates_fast(city, country="India"):
     tuple
         (latitude, longitude) or (None, None) if not found
     """
-    # Check pre-defined cities first
-    city_lower = city.lower().strip()
-    if city_lower in CYCLONE_CITIES:
-        return CYCLONE_CITIES[city_lower]
-    
-    # Fallback to geocoding
-    return get_coordinates(city, country)
+    # Check pre-defined cities (aliases, prefixes, typos) first, fallback to geocoding
+    return match_known_city(city) or get_coordinates(city, country)
@@ -4,8 +4,16 @@ Fetches real-time weather data (Wind, Rain) from Open-Meteo API.
 No API Key required.
 """
 
+import logging
+
+import orjson
 import requests
 
+from .cache import disk_cache, ttl_cache
+from .session import get_session
+
+logger = logging.getLogger(__name__)
+
 def fetch_realtime_weather(lat, lon):
     """
     Fetch current weather conditions for a specific location.
@@ -26,6 +34,26 @@ def fetch_realtime_weather(lat, lon):
         - weather_code (int)
         - is_day (int)
     """
+    # Rounded to ~1 km so nearby/repeat queries hit the cache
+    weather = _fetch_current(round(lat, 2), round(lon, 2))
+    
+    if weather is None:
+        # Return safe fallback values if API fails (so app doesn't crash)
+        return {
+            "wind_speed": 0,
+            "wind_gust": 0,
+            "precipitation": 0,
+            "weather_code": 0,
+            "time": "N/A"
+        }
+    
+    return weather
+
+
+@ttl_cache(ttl=300)
+@disk_cache("weather", expire=300)
+def _fetch_current(lat, lon):
+    """Fetch current conditions from Open-Meteo (memoized for 5 minutes, also on disk)."""
     try:
         url = "https://api.open-meteo.com/v1/forecast"
         params = {
@@ -36,9 +64,9 @@ def fetch_realtime_weather(lat, lon):
             "timezone": "auto"
         }
         
-        response = requests.get(url, params=params, timeout=10)
+        response = get_session().get(url, params=params, timeout=10)
         response.raise_for_status()
-        data = response.json()
+        data = orjson.loads(response.content)
         
         current = data.get("current", {})
         
@@ -50,13 +78,6 @@ def fetch_realtime_weather(lat, lon):
             "time": current.get("time", "")
         }
         
-    except Exception as e:
-        print(f"Error fetching Open-Meteo data: {e}")
-        # Return safe fallback values if API fails (so app doesn't crash)
-        return {
-            "wind_speed": 0,
-            "wind_gust": 0,
-            "precipitation": 0,
-            "weather_code": 0,
-            "time": "N/A"
-        }
+    except (requests.RequestException, ValueError) as e:
+        logger.warning("Open-Meteo fetch failed: %s", e)
+        return None
@@ -3,10 +3,19 @@ Routing Module
 Calculates optimal evacuation routes using OSRM
 """
 
+import logging
 import requests
 import math
+import numpy as np
+import orjson
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-def get_fastest_route(src, dst):
+from .cache import disk_cache, ttl_cache
+from .session import get_session
+
+logger = logging.getLogger(__name__)
+
+def get_fastest_route(src, dst, overview="full"):
     """
     Get the fastest driving route between two points using OSRM.
     
@@ -16,6 +25,9 @@ def get_fastest_route(src, dst):
         Source coordinates (latitude, longitude)
     dst : tuple
         Destination coordinates (latitude, longitude)
+    overview : str
+        OSRM geometry detail: "full" (default), "simplified", or "false"
+        (no geometry; use when only distance/duration are needed)
     
     Returns:
     --------
@@ -23,32 +35,49 @@ def get_fastest_route(src, dst):
         Route information including:
         - distance (meters)
         - duration (seconds)
-        - geometry (GeoJSON)
+        - geometry (GeoJSON, absent when overview="false")
     """
+    # Rounded to ~1 m so repeat queries hit the cache
+    return _fetch_route(
+        round(src[0], 5), round(src[1], 5),
+        round(dst[0], 5), round(dst[1], 5),
+        overview
+    )
+
+
+@ttl_cache(ttl=600)
+@disk_cache("routes", expire=7 * 86400)
+def _fetch_route(src_lat, src_lon, dst_lat, dst_lon, overview):
+    """Fetch a route from OSRM (memoized for 10 minutes in memory, 7 days on disk)."""
     url = (
         f"https://router.project-osrm.org/route/v1/driving/"
-        f"{src[1]},{src[0]};{dst[1]},{dst[0]}"
-        f"?overview=full&geometries=geojson"
+        f"{src_lon},{src_lat};{dst_lon},{dst_lat}"
+        f"?overview={overview}&geometries=geojson"
     )
     
     try:
-        response = requests.get(url, timeout=30)
-        response.raise_for_status()
-        data = response.json()
+        # Stream the (potentially large) geometry payload into one growing buffer
+        # and parse it in place, instead of joining a list of chunks first
+        with get_session().get(url, timeout=30, stream=True) as response:
+            response.raise_for_status()
+            buf = bytearray()
+            for chunk in response.iter_content(chunk_size=65536):
+                buf += chunk
+        data = orjson.loads(buf)
         
         if data.get("code") == "Ok" and data.get("routes"):
             return data["routes"][0]
         else:
             return None
             
-    except requests.RequestException as e:
-        print(f"Routing error: {e}")
+    except (requests.RequestException, orjson.JSONDecodeError) as e:
+        logger.warning("OSRM route request failed: %s", e)
         return None
 
 
-def get_multiple_routes(src, destinations):
+def get_shelter_durations_table(src, destinations):
     """
-    Get routes to multiple destinations and rank by travel time.
+    Rank destinations by driving time with a single OSRM table request.
     
     Parameters:
     -----------
@@ -60,23 +89,167 @@ def get_multiple_routes(src, destinations):
     Returns:
     --------
     list
-        List of route dictionaries sorted by duration
+        Reachable destinations as dictionaries (destination, distance_km,
+        duration_min) sorted by duration, or None if the request failed
     """
+    coords = ";".join(
+        [f"{src[1]},{src[0]}"] +
+        [f"{dest['longitude']},{dest['latitude']}" for dest in destinations]
+    )
+    dest_indices = ";".join(str(i) for i in range(1, len(destinations) + 1))
+    url = (
+        f"https://router.project-osrm.org/table/v1/driving/{coords}"
+        f"?sources=0&destinations={dest_indices}&annotations=duration,distance"
+    )
+    
+    try:
+        response = get_session().get(url, timeout=30)
+        response.raise_for_status()
+        data = orjson.loads(response.content)
+    except (requests.RequestException, orjson.JSONDecodeError) as e:
+        logger.warning("OSRM table request failed: %s", e)
+        return None
+    
+    if data.get("code") != "Ok" or not data.get("durations"):
+        return None
+    
+    durations = data["durations"][0]
+    distances = data.get("distances", [[None] * len(destinations)])[0]
+    
+    ranked = [
+        {
+            "destination": dest,
+            "distance_km": dist / 1000 if dist is not None else None,
+            "duration_min": dur / 60
+        }
+        for dest, dur, dist in zip(destinations, durations, distances)
+        if dur is not None  # unreachable
+    ]
+    ranked.sort(key=lambda x: x["duration_min"])
+    
+    return ranked
+
+
+def _fetch_routes(src, destinations, overview="full"):
+    """Fetch routes to each destination in parallel threads."""
     routes = []
     
-    for dest in destinations:
-        route = get_fastest_route(
-            src,
-            (dest["latitude"], dest["longitude"])
-        )
+    if not destinations:
+        return routes
+    
+    # OSRM calls are network-bound, so fan them out in parallel threads
+    with ThreadPoolExecutor(max_workers=min(16, len(destinations))) as ex:
+        futures = {
+            ex.submit(get_fastest_route, src, (dest["latitude"], dest["longitude"]), overview): dest
+            for dest in destinations
+        }
         
-        if route:
-            routes.append({
-                "destination": dest,
-                "distance_km": route["distance"] / 1000,
-                "duration_min": route["duration"] / 60,
-                "geometry": route["geometry"]
-            })
+        for fut in as_completed(futures):
+            route = fut.result()
+            
+            if route:
+                routes.append({
+                    "destination": futures[fut],
+                    "distance_km": route["distance"] / 1000,
+                    "duration_min": route["duration"] / 60,
+                    "geometry": route.get("geometry")
+                })
+    
+    return routes
+
+
+def nearest_destinations(src, destinations, k=8, max_radius_km=None):
+    """
+    Pre-filter destinations to the k nearest by (approximate) crow-flight distance.
+    
+    Parameters:
+    -----------
+    src : tuple
+        Source coordinates (latitude, longitude)
+    destinations : list
+        List of dictionaries with 'latitude', 'longitude', and other info
+    k : int
+        Maximum number of destinations to keep (default: 8)
+    max_radius_km : float
+        Optional cut-off; destinations further away are dropped
+    
+    Returns:
+    --------
+    list
+        Subset of destinations, nearest first
+    """
+    if not destinations:
+        return []
+    
+    lats = np.fromiter((dest["latitude"] for dest in destinations), dtype=float, count=len(destinations))
+    lons = np.fromiter((dest["longitude"] for dest in destinations), dtype=float, count=len(destinations))
+    # Cheap equirectangular distance is plenty for ranking (UI values use the haversine)
+    dist = approx_distance_vec(src[0], src[1], lats, lons)
+    
+    # argpartition picks the k smallest in O(n); only those are sorted
+    if k < len(dist):
+        idx = np.argpartition(dist, k)[:k]
+    else:
+        idx = np.arange(len(dist))
+    idx = idx[np.argsort(dist[idx])]
+    
+    if max_radius_km is not None:
+        idx = idx[dist[idx] <= max_radius_km]
+    
+    return [destinations[i] for i in idx]
+
+
+def get_multiple_routes(src, destinations, top_k=3, max_candidates=8, max_radius_km=None):
+    """
+    Get routes to multiple destinations and rank by travel time.
+    
+    Destinations are first narrowed to the max_candidates nearest by
+    crow-flight distance. With more than top_k candidates left, they are
+    ranked with one OSRM table request (or geometry-free route requests if
+    the table service fails) and full route geometry is only fetched for
+    the top_k fastest; the remaining entries carry geometry=None.
+    
+    Parameters:
+    -----------
+    src : tuple
+        Source coordinates (latitude, longitude)
+    destinations : list
+        List of dictionaries with 'latitude', 'longitude', and other info
+    top_k : int
+        Number of fastest destinations to fetch route geometry for (default: 3)
+    max_candidates : int
+        Number of nearest destinations sent to OSRM (default: 8)
+    max_radius_km : float
+        Optional crow-flight cut-off for candidate destinations
+    
+    Returns:
+    --------
+    list
+        List of route dictionaries sorted by duration
+    """
+    destinations = nearest_destinations(src, destinations, max_candidates, max_radius_km)
+    
+    ranked = None
+    if len(destinations) > top_k:
+        ranked = get_shelter_durations_table(src, destinations)
+    
+    if ranked is None and len(destinations) > top_k:
+        # Table service unavailable: rank with geometry-free routes instead
+        ranked = _fetch_routes(src, destinations, overview="false")
+        ranked.sort(key=lambda x: x["duration_min"])
+    
+    if ranked is None:
+        # Few destinations: route each directly
+        routes = _fetch_routes(src, destinations)
+    else:
+        # Full geometry only for the fastest candidates
+        fetched = {
+            id(route["destination"]): route
+            for route in _fetch_routes(src, [r["destination"] for r in ranked[:top_k]])
+        }
+        # A failed geometry fetch keeps the ranked row rather than dropping the shelter
+        routes = [fetched.get(id(r["destination"]), dict(r, geometry=None)) for r in ranked[:top_k]]
+        routes += [dict(r, geometry=None) for r in ranked[top_k:]]
     
     # Sort by travel time
     routes.sort(key=lambda x: x["duration_min"])
@@ -103,13 +276,71 @@ def calculate_distance(coord1, coord2):
     lat1, lon1 = math.radians(coord1[0]), math.radians(coord1[1])
     lat2, lon2 = math.radians(coord2[0]), math.radians(coord2[1])
     
-    dlat = lat2 - lat1
-    dlon = lon2 - lon1
+    # Each half-angle sine is computed once and squared by multiplication
+    sdlat = math.sin((lat2 - lat1) * 0.5)
+    sdlon = math.sin((lon2 - lon1) * 0.5)
     
-    a = math.sin(dlat/2)**2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlon/2)**2
-    c = 2 * math.asin(math.sqrt(a))
+    a = sdlat * sdlat + math.cos(lat1) * math.cos(lat2) * sdlon * sdlon
+    c = 2 * math.atan2(math.sqrt(a), math.sqrt(1.0 - a))
     
     # Earth's radius in kilometers
-    r = 6371
+    r = 6371.0
     
     return c * r
+
+
+def haversine_vec(lat1, lon1, lats, lons):
+    """
+    Vectorized Haversine distance from one point to many points.
+    
+    Parameters:
+    -----------
+    lat1, lon1 : float
+        Origin coordinates in degrees
+    lats, lons : array-like
+        Destination coordinates in degrees
+    
+    Returns:
+    --------
+    np.ndarray
+        Distances in kilometers
+    """
+    lat1r = np.radians(lat1)
+    latsr = np.radians(lats)
+    
+    dlat = latsr - lat1r
+    dlon = np.radians(lons) - np.radians(lon1)
+    
+    a = np.sin(dlat * 0.5)**2 + np.cos(lat1r) * np.cos(latsr) * np.sin(dlon * 0.5)**2
+    
+    # Earth's radius in kilometers
+    return 2 * 6371.0 * np.arcsin(np.sqrt(a))
+
+
+def approx_distance_vec(lat1, lon1, lats, lons):
+    """
+    Fast approximate distance from one point to many (equirectangular projection).
+    
+    Needs a single cos per point and no sin/asin, and is well under 1% off
+    at evacuation-scale separations (tens of km), so it is suited to ranking
+    candidates; use haversine_vec / calculate_distance for displayed values.
+    
+    Parameters:
+    -----------
+    lat1, lon1 : float
+        Origin coordinates in degrees
+    lats, lons : array-like
+        Destination coordinates in degrees
+    
+    Returns:
+    --------
+    np.ndarray
+        Approximate distances in kilometers
+    """
+    lats = np.asarray(lats, dtype=float)
+    
+    x = np.radians(np.asarray(lons, dtype=float) - lon1) * np.cos(np.radians((lats + lat1) * 0.5))
+    y = np.radians(lats - lat1)
+    
+    # Earth's radius in kilometers
+    return 6371.0 * np.hypot(x, y)
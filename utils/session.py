@@ -0,0 +1,54 @@
+"""
+HTTP Session Module
+Shared pooled requests session (keep-alive + retries) for the external APIs
+"""
+
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+
+def get_session():
+    """
+    Get the process-wide pooled HTTP session.
+    
+    Reusing one session keeps TCP/TLS connections alive between calls
+    instead of paying a fresh handshake on every request.
+    
+    Returns:
+    --------
+    requests.Session
+        Session with a pooled, retrying adapter mounted on https://
+    """
+    global _SESSION
+    
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                session = requests.Session()
+                # read=0: a request that timed out mid-read is not retried, so
+                # one hung upstream call cannot stack up several full timeouts
+                adapter = HTTPAdapter(
+                    pool_connections=16,
+                    pool_maxsize=32,
+                    max_retries=Retry(total=3, read=0, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+                )
+                session.mount("https://", adapter)
+                _SESSION = session
+    
+    return _SESSION
+
+
+def close():
+    """Close the shared session (a new one is created on next use)."""
+    global _SESSION
+    
+    with _SESSION_LOCK:
+        if _SESSION is not None:
+            _SESSION.close()
+            _SESSION = None
@@ -13,6 +13,7 @@ def compute_storm_stress(df):
     - Wind speed computed from u and v components
     - Gust proxy estimated as 1.3x wind speed (ERA5 doesn't provide gusts directly)
     - Storm stress = gust_proxy² + (precipitation × 10)
+      (evaluated as 1.69 × (u² + v²) + precipitation × 10)
     
     Parameters:
     -----------
@@ -25,29 +26,80 @@ def compute_storm_stress(df):
     Returns:
     --------
     pd.DataFrame
-        Original DataFrame with added columns:
+        Original DataFrame with added float32 columns:
         - wind_speed
         - gust_proxy
         - storm_stress
     """
+    # Work on the raw arrays and assign all outputs at the end
+    # ERA5 is published as float32, so compute in float32 (half the memory traffic)
+    u = df["10m_u_component_of_wind"].to_numpy(dtype=np.float32, copy=False)
+    v = df["10m_v_component_of_wind"].to_numpy(dtype=np.float32, copy=False)
+    p = df["total_precipitation"].to_numpy(dtype=np.float32, copy=False)
+    
+    # Outputs are pre-allocated (one contiguous row each) and filled in place
+    out = np.empty((3, len(u)), dtype=np.float32)
+    wind_speed, gust_proxy, storm_stress = out
+    
     # Calculate wind speed from u and v components
-    df["wind_speed"] = np.sqrt(
-        df["10m_u_component_of_wind"] ** 2 +
-        df["10m_v_component_of_wind"] ** 2
-    )
+    wind_speed_sq = np.multiply(u, u)
+    wind_speed_sq += np.multiply(v, v, out=storm_stress)
+    np.sqrt(wind_speed_sq, out=wind_speed)
     
     # Gust proxy (ERA5 does not give gust directly)
     # Factor of 1.3 is commonly used in meteorological studies
-    df["gust_proxy"] = df["wind_speed"] * 1.3
+    np.multiply(wind_speed, np.float32(1.3), out=gust_proxy)
     
     # Storm Stress Formula (scientifically defensible)
     # Wind load is proportional to velocity squared
     # Precipitation adds additional stress factor
-    df["storm_stress"] = (df["gust_proxy"] ** 2) + (df["total_precipitation"] * 10)
+    # gust_proxy² == 1.3² * (u² + v²), so square the magnitude directly (no sqrt round-trip)
+    np.multiply(p, np.float32(10.0), out=storm_stress)
+    storm_stress += np.multiply(wind_speed_sq, np.float32(1.69), out=wind_speed_sq)
+    
+    df[["wind_speed", "gust_proxy", "storm_stress"]] = out.T
     
     return df
 
 
+# Risk bands: stress <= 1500 LOW, <= 2500 MODERATE, above that HIGH
+RISK_THRESHOLDS = np.array([1500.0, 2500.0])
+_RISK_LABELS = np.array(["LOW", "MODERATE", "HIGH"])
+_RISK_COLORS = np.array(["green", "orange", "red"])
+_RISK_DESCRIPTIONS = np.array([
+    "✅ Low cyclone risk - Normal precautions advised",
+    "⚡ Moderate cyclone risk - Stay alert and prepare",
+    "⚠️ Severe cyclone risk - Immediate evacuation recommended"
+])
+
+
+def _risk_index(stress):
+    """Band index (0=LOW, 1=MODERATE, 2=HIGH) for each stress value."""
+    stress = np.asarray(stress, dtype=float)
+    # side="left" keeps the thresholds themselves in the lower band
+    idx = np.searchsorted(RISK_THRESHOLDS, stress, side="left")
+    # NaN sorts past every threshold; treat it as LOW like the scalar comparisons did
+    return np.where(np.isnan(stress), 0, idx)
+
+
+def classify_risk_vec(stress):
+    """
+    Classify risk zones for many storm stress values at once.
+    
+    Parameters:
+    -----------
+    stress : array-like
+        Storm stress values (e.g. a whole ERA5 stress column or grid)
+    
+    Returns:
+    --------
+    tuple
+        (risk_levels, colors) as NumPy string arrays shaped like stress
+    """
+    idx = _risk_index(stress)
+    return _RISK_LABELS[idx], _RISK_COLORS[idx]
+
+
 def classify_risk(avg_stress):
     """
     Classify risk zone based on average storm stress.
@@ -62,12 +114,8 @@ def classify_risk(avg_stress):
     tuple
         (risk_level, color, description)
     """
-    if avg_stress > 2500:
-        return ("HIGH", "red", "⚠️ Severe cyclone risk - Immediate evacuation recommended")
-    elif avg_stress > 1500:
-        return ("MODERATE", "orange", "⚡ Moderate cyclone risk - Stay alert and prepare")
-    else:
-        return ("LOW", "green", "✅ Low cyclone risk - Normal precautions advised")
+    i = int(_risk_index(avg_stress))
+    return (str(_RISK_LABELS[i]), str(_RISK_COLORS[i]), str(_RISK_DESCRIPTIONS[i]))
 
 
 def get_stress_statistics(df):
@@ -84,12 +132,25 @@ def get_stress_statistics(df):
     dict
         Statistics dictionary
     """
+    arr = df["storm_stress"].to_numpy()
+    
+    # Empty input: every statistic is NaN (as the pandas reductions returned)
+    if arr.size == 0:
+        return dict.fromkeys(
+            ["mean", "max", "min", "std", "median", "percentile_90", "percentile_95"],
+            np.nan
+        )
+    
+    # One batched quantile call instead of separate min/median/percentile/max scans
+    # (nan-aware with ddof=1 to match the pandas reductions)
+    q_min, q_median, q_90, q_95, q_max = np.nanquantile(arr, [0.0, 0.5, 0.90, 0.95, 1.0])
+    
     return {
-        "mean": df["storm_stress"].mean(),
-        "max": df["storm_stress"].max(),
-        "min": df["storm_stress"].min(),
-        "std": df["storm_stress"].std(),
-        "median": df["storm_stress"].median(),
-        "percentile_90": df["storm_stress"].quantile(0.90),
-        "percentile_95": df["storm_stress"].quantile(0.95)
+        "mean": np.nanmean(arr, dtype=np.float64),
+        "max": q_max,
+        "min": q_min,
+        "std": np.nanstd(arr, dtype=np.float64, ddof=1),
+        "median": q_median,
+        "percentile_90": q_90,
+        "percentile_95": q_95
     }